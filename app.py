@@ -1,18 +1,34 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+import orjson
 import asyncio
-from solver import solve_quiz
+import logging
+from contextlib import asynccontextmanager
+from solver import solve_quiz, HTTP_CLIENT
+from llm_client import LLM_CLIENT
 import os
 
-app = FastAPI()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
 
 EMAIL = os.getenv("STUDENT_EMAIL")
 SECRET = os.getenv("STUDENT_SECRET")
 
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await HTTP_CLIENT.aclose()
+    await LLM_CLIENT.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
 @app.post("/")
 async def quiz_handler(request: Request):
     try:
-        payload = await request.json()
+        payload = orjson.loads(await request.body())
     except:
         return JSONResponse({"error": "invalid JSON"}, status_code=400)
 
@@ -32,7 +48,5 @@ async def quiz_handler(request: Request):
         )
         return JSONResponse(result, status_code=200)
     except Exception as e:
-        print("SOLVER ERROR:", type(e), str(e))
-        import traceback
-        traceback.print_exc()
+        logger.exception("Solver error: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
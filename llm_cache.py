@@ -0,0 +1,75 @@
+import time
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LLMCache:
+    """
+    In-memory LLM response cache.
+    Exact matches are keyed by sha256(prompt) via get(); get_similar() finds
+    near-duplicate prompts by embedding (cosine similarity >= threshold).
+    Entries expire after `ttl` seconds and the oldest are evicted past `maxsize`.
+    """
+
+    def __init__(self, maxsize=512, ttl=3600, threshold=0.92):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.entries = OrderedDict()   # key -> (timestamp, response)
+        self.embeddings = {}           # key -> unit-norm embedding
+
+    @staticmethod
+    def key(prompt):
+        return hashlib.sha256(prompt.encode()).hexdigest()
+
+    def _expired(self, key):
+        ts, _ = self.entries[key]
+        if time.monotonic() - ts > self.ttl:
+            self.entries.pop(key)
+            self.embeddings.pop(key, None)
+            return True
+        return False
+
+    def get(self, prompt):
+        key = self.key(prompt)
+        if key in self.entries and not self._expired(key):
+            self.entries.move_to_end(key)
+            return self.entries[key][1]
+        return None
+
+    def get_similar(self, embedding):
+        if not self.embeddings:
+            return None
+
+        keys = list(self.embeddings)
+        matrix = np.stack([self.embeddings[k] for k in keys])
+        q = np.asarray(embedding, dtype=np.float64)
+        qn = np.linalg.norm(q)
+        if qn == 0:
+            return None
+        sims = matrix @ (q / qn)
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+
+        hit = keys[best]
+        if self._expired(hit):
+            return None
+        self.entries.move_to_end(hit)
+        return self.entries[hit][1]
+
+    def put(self, prompt, response, embedding=None):
+        key = self.key(prompt)
+        self.entries[key] = (time.monotonic(), response)
+        self.entries.move_to_end(key)
+        if embedding is not None:
+            v = np.asarray(embedding, dtype=np.float64)
+            n = np.linalg.norm(v)
+            if n > 0:
+                self.embeddings[key] = v / n
+
+        while len(self.entries) > self.maxsize:
+            old, _ = self.entries.popitem(last=False)
+            self.embeddings.pop(old, None)
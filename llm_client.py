@@ -1,33 +1,128 @@
 import os
+import logging
 import httpx
+import orjson
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_exception
+from llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
 
 DEEPSEEK_KEY = os.getenv("DEEPSEEK_API_KEY")
 AIPIPE_KEY = os.getenv("AIPIPE_API_KEY")
 
+# Semantic (embedding) matching is opt-in: near-identical prompts that differ
+# only in a number would otherwise share an answer
+SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE") == "1"
+LLM_CACHE = LLMCache(maxsize=512, ttl=3600, threshold=0.92)
+# text-embedding-3-small takes 8191 tokens; stay well under it
+EMBED_MAX_CHARS = 20_000
+
+# Shared client: keeps TCP/TLS connections alive across LLM calls.
+# Tight per-phase timeouts so a stalled call fails fast and can be retried.
+LLM_CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(connect=3.0, read=20.0, write=5.0, pool=2.0),
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+)
+
+
+def build_messages(prompt, system=None):
+    # Static instructions go in a leading system message so providers can
+    # reuse their prefix cache; only the user message varies between calls
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+    return messages
 
-async def deepseek_call(prompt):
-    async with httpx.AsyncClient(timeout=45) as client:
-        r = await client.post(
-            "https://api.deepseek.com/chat/completions",
-            json={"model": "deepseek-chat", "messages": [{"role": "user", "content": prompt}]},
-            headers={"Authorization": f"Bearer {DEEPSEEK_KEY}"}
-        )
-        return r.json()["choices"][0]["message"]["content"]
 
+async def deepseek_call(prompt, system=None):
+    r = await LLM_CLIENT.post(
+        "https://api.deepseek.com/chat/completions",
+        content=orjson.dumps({"model": "deepseek-chat", "messages": build_messages(prompt, system)}),
+        headers={"Authorization": f"Bearer {DEEPSEEK_KEY}", "Content-Type": "application/json"}
+    )
+    r.raise_for_status()
+    return orjson.loads(r.content)["choices"][0]["message"]["content"]
 
-async def aipipe_call(prompt):
-    async with httpx.AsyncClient(timeout=45) as client:
-        r = await client.post(
-            "https://api.ai-pipe.com/v1/chat/completions",
-            json={"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}]},
-            headers={"Authorization": f"Bearer {AIPIPE_KEY}"}
-        )
-        return r.json()["choices"][0]["message"]["content"]
 
+async def aipipe_call(prompt, system=None):
+    r = await LLM_CLIENT.post(
+        "https://api.ai-pipe.com/v1/chat/completions",
+        content=orjson.dumps({"model": "gpt-4o-mini", "messages": build_messages(prompt, system)}),
+        headers={"Authorization": f"Bearer {AIPIPE_KEY}", "Content-Type": "application/json"}
+    )
+    r.raise_for_status()
+    return orjson.loads(r.content)["choices"][0]["message"]["content"]
 
-async def ask_llm(prompt):
+
+async def aipipe_embed(text):
+    r = await LLM_CLIENT.post(
+        "https://api.ai-pipe.com/v1/embeddings",
+        content=orjson.dumps({"model": "text-embedding-3-small", "input": text}),
+        headers={"Authorization": f"Bearer {AIPIPE_KEY}", "Content-Type": "application/json"}
+    )
+    return orjson.loads(r.content)["data"][0]["embedding"]
+
+
+async def llm_call(prompt, system=None):
     try:
-        return await deepseek_call(prompt)
+        return await deepseek_with_retry(prompt, system)
     except Exception as e:
-        print("LLM ERROR:", e)
-        return ""   # never fallback to another provider
+        logger.warning("LLM error (deepseek), falling back to aipipe: %s", e)
+        try:
+            return await aipipe_call(prompt, system)
+        except Exception as e:
+            logger.error("LLM error (aipipe): %s", e)
+            return ""
+
+
+def is_retryable(exc):
+    # Timeouts, rate limits and server errors may pass on retry; other 4xx won't
+    if isinstance(exc, httpx.TimeoutException):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+
+async def deepseek_with_retry(prompt, system=None):
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=0.3, max=2),
+        retry=retry_if_exception(is_retryable),
+        reraise=True
+    ):
+        with attempt:
+            return await deepseek_call(prompt, system)
+
+
+async def ask_llm(prompt, system=None, cache=True):
+    """
+    Asks DeepSeek (AI-Pipe as fallback). Pass cache=False for prompts that
+    produce a final answer, so a retry after a wrong submission asks again.
+    """
+    if not cache:
+        return await llm_call(prompt, system)
+
+    cache_key = f"{system}\n{prompt}" if system else prompt
+    cached = LLM_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Only embed on an exact miss, and only prompts the embedding model accepts
+    embedding = None
+    if SEMANTIC_CACHE and len(cache_key) <= EMBED_MAX_CHARS:
+        try:
+            embedding = await aipipe_embed(cache_key)
+        except Exception as e:
+            logger.warning("Embedding error: %s", e)
+        else:
+            cached = LLM_CACHE.get_similar(embedding)
+            if cached is not None:
+                return cached
+
+    resp = await llm_call(prompt, system)
+    if resp:
+        LLM_CACHE.put(cache_key, resp, embedding)
+    return resp
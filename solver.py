@@ -1,27 +1,43 @@
-import json
+import orjson
+import json5
 import httpx
+import asyncio
 import os
 import io
+import re
+import logging
+import numpy as np
 import pandas as pd
-from urllib.parse import urljoin
+import pyarrow as pa
+import numba
+import xxhash
+from cachetools import TTLCache
+from urllib.parse import urljoin, urlsplit
+from selectolax.lexbor import LexborHTMLParser
 from llm_client import ask_llm
 
 
+logger = logging.getLogger(__name__)
+
 BROWSERLESS_KEY = os.getenv("BROWSERLESS_API_KEY")
 
+# Shared client: reuses connections to browserless, quiz hosts and file hosts.
+# A long keepalive keeps those connections hot across quiz iterations, which
+# are usually several seconds apart (httpx's default expiry is 5s).
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=60,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=60)
+)
 
-async def fetch_rendered_html(url):
-    async with httpx.AsyncClient(timeout=60) as client:
-        r = await client.post(
-            f"https://chrome.browserless.io/content?token={BROWSERLESS_KEY}",
-            json={"url": url}
-        )
-        r.raise_for_status()
-        return r.text
+JSON_HEADERS = {"Content-Type": "application/json"}
 
+# Caps concurrent page/file fetches so we don't hammer a single host
+FETCH_LIMIT = asyncio.Semaphore(8)
 
-async def parse_quiz(html):
-    prompt = f"""
+# Static instruction blocks, sent as system messages ahead of the per-call
+# content. Keep them free of interpolation so provider prefix caching applies.
+PARSE_QUIZ_PROMPT = """
 Extract the following from this rendered HTML page:
 - Question/instruction
 - Submit endpoint URL
@@ -29,27 +45,9 @@ Extract the following from this rendered HTML page:
 - Download file URLs
 Return VALID JSON ONLY with keys: question, submit_url, answer_format, file_urls.
 Do NOT add code fences. Do NOT add markdown. Do NOT add explanations.
-HTML: {html}
 """
 
-    resp = await ask_llm(prompt)
-    print("\n=== RAW LLM RESPONSE (parse_quiz) ===\n", resp, "\n=== END ===\n")
-
-    cleaned = resp.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`")
-        cleaned = cleaned.replace("json", "", 1).strip()
-
-    try:
-        return json.loads(cleaned)
-    except:
-        raise RuntimeError(f"LLM returned non-JSON output: {resp[:200]}")
-
-
-
-
-async def classify_question(question):
-    prompt = f"""
+CLASSIFY_PROMPT = """
 Your job is to classify WHAT TYPE of operation is required to answer the question.
 Possible categories (choose exactly one):
 - scrape → information must be fetched/extracted from another page/URL shown in the question
@@ -59,16 +57,254 @@ Possible categories (choose exactly one):
 IMPORTANT: Do NOT choose 'direct_value' or attempt to return the answer directly even if numbers appear in the question.
 If the question only shows a number, this is likely misleading — choose based on the overall task type instead.
 Return STRICT JSON ONLY:
-{{
+{
   "task": "<scrape | tabular | file_lookup | other>"
-}}
-Question:
-{question}
+}
 """
-    resp = await ask_llm(prompt)
-    cleaned = resp.strip().replace("```", "").replace("json", "")
+
+TABULAR_PROMPT = """
+You are given a question and a table summary. Identify the correct numeric result.
+Which of the available computed values is the correct final answer?
+Return ONLY the number.
+"""
+
+SCRAPE_URLS_PROMPT = """
+Extract the URL(s) that must be scraped from this question text.
+Return ONLY JSON: { "urls": [ ... ] }
+"""
+
+MAX_HTML_CHARS = 40_000
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+WHITESPACE_RE = re.compile(r"\s+")
+MAX_TABLE_HTML = 5_000_000
+NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+# Rendered pages by URL and parsed quizzes by HTML hash, reused across retries
+RENDER_CACHE = TTLCache(maxsize=256, ttl=600)
+PARSE_CACHE = TTLCache(maxsize=256, ttl=600)
+
+# Whitelist of bare "the <stat> of <column>" questions. Anything else
+# (filters, transforms, distinct/unique, row ranges) goes to the LLM.
+STAT_QUESTION_RE = re.compile(
+    r"^\s*(?:what is |find |compute |calculate )?(?:the )?"
+    r"(sum|total|mean|average|count|max|maximum|min|minimum) of (?:the )?"
+    r"[\"']?([\w-]+)[\"']?(?: column)?\s*[?.]?\s*$",
+    re.IGNORECASE
+)
+STAT_ALIASES = {
+    "sum": "sum", "total": "sum",
+    "mean": "mean", "average": "mean",
+    "count": "count",
+    "max": "max", "maximum": "max",
+    "min": "min", "minimum": "min"
+}
+GENERIC_TARGETS = {"value", "values", "number", "numbers"}
+
+NUMBA_MIN_ROWS = 100_000
+
+MAX_BYTES = 20_000_000
+THREAD_DECODE_BYTES = 1_000_000
+TEXT_MIME_TYPES = {"application/json", "application/xml"}
+TEXT_EXTENSIONS = (".csv", ".tsv", ".txt", ".json", ".html", ".htm", ".xml", ".md")
+QUIZ_FILE_EXTENSIONS = (".csv", ".pdf", ".json", ".txt")
+MIN_QUESTION_CHARS = 20
+
+
+async def fetch_rendered_html(url):
+    r = await HTTP_CLIENT.post(
+        f"https://chrome.browserless.io/content?token={BROWSERLESS_KEY}",
+        content=orjson.dumps({"url": url}),
+        headers=JSON_HEADERS
+    )
+    r.raise_for_status()
+    return r.text
+
+
+async def fetch_url(url):
+    async with FETCH_LIMIT:
+        return await HTTP_CLIENT.get(url)
+
+
+async def warm_connection(url):
+    # Opens (or refreshes) a pooled connection to the URL's host so a later
+    # request there skips DNS/TCP/TLS setup; failures don't matter
+    parts = urlsplit(url)
+    try:
+        await HTTP_CLIENT.head(f"{parts.scheme}://{parts.netloc}/")
+    except Exception:
+        pass
+
+
+async def download_file(url):
+    """
+    Streams a file download. Returns (content_type, body_bytes).
+    Raises ValueError once the body passes MAX_BYTES: a truncated file
+    (e.g. a CSV cut mid-row) would silently give wrong results downstream.
+    """
+    chunks = []
+    size = 0
+    async with FETCH_LIMIT:
+        async with HTTP_CLIENT.stream("GET", url) as resp:
+            content_type = resp.headers.get("content-type", "")
+            async for chunk in resp.aiter_bytes():
+                if size + len(chunk) > MAX_BYTES:
+                    raise ValueError(f"file exceeds {MAX_BYTES} bytes")
+                chunks.append(chunk)
+                size += len(chunk)
+    return content_type, b"".join(chunks)
+
+
+def is_text_file(filename, content_type):
+    # Exact MIME match: substrings like "xml" also hit xlsx/docx archives
+    mime = content_type.split(";")[0].strip().lower()
+    return (
+        filename.lower().endswith(TEXT_EXTENSIONS)
+        or mime.startswith("text/")
+        or mime in TEXT_MIME_TYPES
+    )
+
+
+async def decode_text(data):
+    # Large bodies are decoded off the event loop
+    if len(data) > THREAD_DECODE_BYTES:
+        return await asyncio.to_thread(data.decode, "utf-8", "ignore")
+    return data.decode("utf-8", "ignore")
+
+
+async def files_for_prompt(file_contents):
+    # Text bodies are decoded only here, when a prompt needs them;
+    # binary bodies are summarized rather than dumped into the prompt
+    files = []
+    for fc in file_contents:
+        if fc["binary"]:
+            content = f"<binary file, {len(fc['bytes'])} bytes>"
+        else:
+            content = await decode_text(fc["bytes"])
+        files.append({"filename": fc["filename"], "content": content})
+    return files
+
+
+def compact_html(html):
+    """
+    Drops scripts, styles, SVGs and comments from rendered HTML and collapses
+    whitespace, keeping head + tail if the result is still too long.
+    """
+    tree = LexborHTMLParser(COMMENT_RE.sub("", html))
+    tree.strip_tags(["script", "style", "svg", "noscript"])
+    compact = WHITESPACE_RE.sub(" ", tree.html or "")
+
+    if len(compact) > MAX_HTML_CHARS:
+        head = MAX_HTML_CHARS * 3 // 4
+        tail = MAX_HTML_CHARS - head
+        compact = compact[:head] + " ... " + compact[-tail:]
+    return compact
+
+
+def extract_tables(html):
+    """
+    Parses every <table> on a page with pd.read_html (which handles thousands
+    separators, <thead> headers and colspan/rowspan) and stacks them into one
+    DataFrame. Skips oversized pages and pages without a <table> tag.
+    Returns None if the page has no usable table.
+    """
+    if len(html) > MAX_TABLE_HTML or "<table" not in html.lower():
+        return None
+    try:
+        tables = pd.read_html(io.StringIO(html))
+    except Exception:
+        return None
+    return tables[0] if len(tables) == 1 else pd.concat(tables, axis=0, ignore_index=True)
+
+
+def has_distinct_numbers(text, n=3):
+    seen = set()
+    for m in NUM_RE.finditer(text):
+        seen.add(m.group())
+        if len(seen) >= n:
+            return True
+    return False
+
+
+def parse_llm_json(text):
+    """
+    Strips markdown code fences from an LLM reply and parses it as JSON,
+    retrying with json5 for trailing commas, single quotes and the like.
+    """
+    cleaned = FENCE_RE.sub("", text.strip()).strip()
+    try:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
+        return json5.loads(cleaned)
+
+
+def parse_quiz_layout(html):
+    """
+    Deterministic parse for the common quiz layout: a <form action> to submit
+    to, file links, and dedicated question / answer-format elements (matched
+    by exact id or class, not substring). Returns None unless every field is
+    found and the question is long enough to be the full instruction.
+    """
+    tree = LexborHTMLParser(html)
+
+    form = tree.css_first("form[action]")
+    submit_url = form.attributes.get("action") if form else None
+
+    file_urls = []
+    for a in tree.css("a[href]"):
+        href = a.attributes.get("href") or ""
+        if href.lower().split("?")[0].endswith(QUIZ_FILE_EXTENSIONS) and href not in file_urls:
+            file_urls.append(href)
+
+    fmt = tree.css_first("#answer-format, .answer-format, #answer_format, .answer_format")
+    answer_format = fmt.text(strip=True) if fmt else ""
+
+    node = tree.css_first("#question, .question")
+    question = node.text(separator=" ", strip=True) if node else ""
+    if len(question) < MIN_QUESTION_CHARS:
+        return None
+
+    if not (question and submit_url and answer_format and file_urls):
+        return None
+    return {
+        "question": question,
+        "submit_url": submit_url,
+        "answer_format": answer_format,
+        "file_urls": file_urls
+    }
+
+
+async def parse_quiz(html):
+    key = xxhash.xxh64(html.encode()).hexdigest()
+    if key in PARSE_CACHE:
+        return PARSE_CACHE[key]
+
+    parsed = parse_quiz_layout(html)
+    if parsed is not None:
+        logger.info("Parsed quiz page deterministically (no LLM call)")
+        PARSE_CACHE[key] = parsed
+        return parsed
+
+    html = compact_html(html)
+    resp = await ask_llm(f"HTML: {html}", system=PARSE_QUIZ_PROMPT)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw LLM response (parse_quiz):\n%s", resp)
+
     try:
-        return json.loads(cleaned).get("task", "other")
+        parsed = parse_llm_json(resp)
+    except:
+        raise RuntimeError(f"LLM returned non-JSON output: {resp[:200]}")
+
+    PARSE_CACHE[key] = parsed
+    return parsed
+
+
+
+
+async def classify_question(question):
+    resp = await ask_llm(f"Question:\n{question}", system=CLASSIFY_PROMPT)
+    try:
+        return parse_llm_json(resp).get("task", "other")
     except:
         return "other"
 
@@ -78,14 +314,133 @@ Question:
 
 
 
+def read_csv_fast(raw):
+    """
+    Parses raw CSV bytes with pandas' multithreaded pyarrow engine, falling
+    back to the default C parser for input pyarrow rejects (e.g. ragged rows
+    or invalid UTF-8).
+    """
+    try:
+        return pd.read_csv(io.BytesIO(raw), engine="pyarrow", dtype_backend="pyarrow")
+    except Exception:
+        return pd.read_csv(io.BytesIO(raw), encoding_errors="ignore")
+
+
+def stack_frames(dfs):
+    """
+    Stacks DataFrames row-wise. When every frame has the same unique columns
+    and dtypes, columns are concatenated directly — with pyarrow for
+    Arrow-backed frames (read_csv_fast's output), with numpy for plain numpy
+    dtypes — skipping pd.concat's schema alignment. Otherwise falls back to
+    pd.concat.
+    """
+    if len(dfs) == 1:
+        return dfs[0]
+
+    cols = list(dfs[0].columns)
+    dtypes = list(dfs[0].dtypes)
+    same_schema = (
+        dfs[0].columns.is_unique
+        and all(list(d.columns) == cols and list(d.dtypes) == dtypes for d in dfs[1:])
+    )
+    if same_schema and all(isinstance(t, pd.ArrowDtype) for t in dtypes):
+        tables = [pa.Table.from_pandas(d, preserve_index=False) for d in dfs]
+        return pa.concat_tables(tables).to_pandas(types_mapper=pd.ArrowDtype)
+    if same_schema and all(isinstance(t, np.dtype) for t in dtypes):
+        return pd.DataFrame({c: np.concatenate([d[c].to_numpy() for d in dfs]) for c in cols})
+    return pd.concat(dfs, axis=0, ignore_index=True)
+
+
+# No fastmath: "reassoc" would let LLVM fold away the compensation term,
+# and "nnan" would break the x != x NaN check
+@numba.njit(cache=True)
+def nb_stats(arr):
+    """
+    Single-pass NaN-skipping (sum, mean, min, max, count) over a float64 array.
+    The sum uses Neumaier compensation to match pandas' accuracy.
+    """
+    total = 0.0
+    comp = 0.0
+    count = 0
+    lo = np.inf
+    hi = -np.inf
+    for x in arr:
+        if x != x:
+            continue
+        t = total + x
+        if abs(total) >= abs(x):
+            comp += (total - t) + x
+        else:
+            comp += (x - t) + total
+        total = t
+        count += 1
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+    total += comp
+    if count == 0:
+        return total, np.nan, np.nan, np.nan, 0
+    return total, total / count, lo, hi, count
+
+
+# Compile at import so the first large CSV doesn't pay the JIT cost
+nb_stats(np.zeros(1, dtype=np.float64))
+
+
+def summarize_columns(num_df):
+    """
+    Returns {column: {sum, mean, count, max, min}} for an all-numeric frame.
+    Large frames use the nb_stats kernel; smaller ones a single DataFrame.agg.
+    """
+    if len(num_df) > NUMBA_MIN_ROWS:
+        results = {}
+        for i, col in enumerate(num_df.columns):
+            arr = num_df.iloc[:, i].to_numpy(dtype=np.float64, na_value=np.nan)
+            total, mean, lo, hi, count = nb_stats(arr)
+            results[col] = {
+                "sum": float(total),
+                "mean": float(mean),
+                "count": int(count),
+                "max": float(hi),
+                "min": float(lo)
+            }
+        return results
+
+    stats = num_df.agg(["sum", "mean", "count", "max", "min"]).to_dict()
+    return {
+        col: {
+            "sum": float(s["sum"]),
+            "mean": float(s["mean"]),
+            "count": int(s["count"]),
+            "max": float(s["max"]),
+            "min": float(s["min"])
+        }
+        for col, s in stats.items()
+    }
+
+
+def match_stat(question, column):
+    # Returns the statistic for a bare "the <stat> of <column|values>"
+    # question about the given column, else None
+    m = STAT_QUESTION_RE.match(question)
+    if not m:
+        return None
+    target = m.group(2).lower()
+    if target not in GENERIC_TARGETS and target != str(column).lower():
+        return None
+    return STAT_ALIASES[m.group(1).lower()]
+
+
 async def compute_tabular(question, file_contents):
     dfs = []
     for fc in file_contents:
+        if fc["binary"]:
+            continue
         name = fc["filename"]
-        text = fc["content"]
         if name.lower().endswith(".csv"):
             try:
-                df = pd.read_csv(io.StringIO(text))
+                df = read_csv_fast(fc["bytes"])
                 dfs.append(df)
             except:
                 continue
@@ -94,35 +449,30 @@ async def compute_tabular(question, file_contents):
         return None
 
     # Combine all CSVs (side by side or stacked — whichever matches)
-    df = pd.concat(dfs, axis=0, ignore_index=True)
+    df = stack_frames(dfs)
 
     numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
     if not numeric_cols:
         return None
 
-    # Compute everything possible
-    results = {}
-    for col in numeric_cols:
-        series = pd.to_numeric(df[col], errors="coerce").dropna()
-        results[col] = {
-            "sum": float(series.sum()),
-            "mean": float(series.mean()),
-            "count": int(series.count()),
-            "max": float(series.max()),
-            "min": float(series.min())
-        }
+    # Compute everything possible (NaNs are skipped)
+    num_df = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    results = summarize_columns(num_df)
+
+    # One column and an unambiguous keyword → no need to ask the LLM
+    if len(results) == 1:
+        col, col_stats = next(iter(results.items()))
+        stat = match_stat(question, col)
+        if stat:
+            return float(col_stats[stat])
 
     # Ask LLM which among these results is the answer
-    prompt = f"""
-You are given a question and a table summary. Identify the correct numeric result.
-Question:
-{question}
-Available computed values:
-{results}
-Which of these values is the correct final answer?
-Return ONLY the number.
-"""
-    resp = await ask_llm(prompt)
+    summary = orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS).decode()
+    resp = await ask_llm(
+        f"Question:\n{question}\nAvailable computed values:\n{summary}",
+        system=TABULAR_PROMPT,
+        cache=False
+    )
     cleaned = resp.strip().replace("```", "").replace(",", "")
     try:
         return float(cleaned)
@@ -137,58 +487,64 @@ async def compute_answer(question, file_urls, answer_format, current_page_url):
     Core solver: classifies question, fetches referenced pages/files, and routes
     to the proper solving engine (tabular / file lookup / scrape / LLM fallback).
     """
-    task = await classify_question(question)
-    print(f"🧠 CLASSIFIED TASK → {task}")
+    # Speculatively extract scrape URLs while classifying, so a scrape task
+    # doesn't wait on two LLM round-trips back to back
+    extract_task = asyncio.create_task(
+        ask_llm(f"Question: {question}", system=SCRAPE_URLS_PROMPT)
+    )
+    try:
+        task = await classify_question(question)
+    except BaseException:
+        extract_task.cancel()
+        raise
+    if task != "scrape":
+        extract_task.cancel()
+    logger.info("Classified task → %s", task)
 
     # -------------------------------
     # 1) SCRAPE — fetch referenced pages first
     # -------------------------------
     if task == "scrape":
-        scrape_url_prompt = f"""
-    Extract the URL(s) that must be scraped from this question text.
-    Return ONLY JSON: {{ "urls": [ ... ] }}
-    Question: {question}
-    """
         try:
-            u = await ask_llm(scrape_url_prompt)
-            scrape_urls = json.loads(u.replace("```", "")).get("urls", [])
+            u = await extract_task
+            scrape_urls = parse_llm_json(u).get("urls", [])
         except:
             scrape_urls = []
     
-        # Visit scraped URLs
+        # Visit scraped URLs concurrently
+        abs_urls = [urljoin(current_page_url, u) for u in scrape_urls]
+        responses = await asyncio.gather(*(fetch_url(u) for u in abs_urls), return_exceptions=True)
         page_contents = []
-        async with httpx.AsyncClient(timeout=60) as client:
-            for u in scrape_urls:
-                abs_url = urljoin(current_page_url, u)
-                html = (await client.get(abs_url)).text
-                page_contents.append({"url": abs_url, "content": html})
+        for abs_url, resp in zip(abs_urls, responses):
+            if isinstance(resp, Exception):
+                logger.warning("Scrape failed: %s (%s)", abs_url, resp)
+                continue
+            page_contents.append({"url": abs_url, "content": resp.text})
     
         # Detect numeric tables (even without <table> tag)
-        import re
         for p in page_contents:
-            nums = re.findall(r"\d+(?:\.\d+)?", p["content"])
-            # 3+ distinct numbers usually indicate summing/aggregation
-            if len(set(nums)) >= 3:
-                try:
-                    tables = pd.read_html(p["content"])
-                    dfs = pd.concat(tables, axis=0, ignore_index=True)
-                except Exception:
-                    # Synthetic CSV if no actual table but numeric grid exists
-                    df = pd.DataFrame({"value": list(map(float, nums))})
-                    dfs = df
-    
-                csv_str = dfs.to_csv(index=False)
-                new_fc = [{"filename": "scraped_table.csv", "content": csv_str}]
-                tab_ans = await compute_tabular(question, new_fc)
-                if tab_ans is not None:
-                    print(f"✔ TABULAR COMPUTE SUCCESS (via scrape) → {tab_ans}")
-                    return tab_ans
+            dfs = extract_tables(p["content"])
+            if dfs is None:
+                # 3+ distinct numbers usually indicate summing/aggregation
+                if not has_distinct_numbers(p["content"], 3):
+                    continue
+                # Synthetic CSV if no actual table but numeric grid exists
+                nums = NUM_RE.findall(p["content"])
+                dfs = pd.DataFrame({"value": np.fromiter(map(float, nums), dtype=np.float64)})
+
+            csv_bytes = dfs.to_csv(index=False).encode()
+            new_fc = [{"filename": "scraped_table.csv", "bytes": csv_bytes, "binary": False}]
+            tab_ans = await compute_tabular(question, new_fc)
+            if tab_ans is not None:
+                logger.info("Tabular compute success (via scrape) → %s", tab_ans)
+                return tab_ans
     
         # Else → not tabular, extract text from scraped pages
         return await ask_llm(
-            f"Extract the exact final answer from the scraped content.\n"
-            f"Scraped pages: {page_contents}\n"
-            f"Return ONLY the answer in this format = {answer_format}"
+            f"Return ONLY the answer in this format = {answer_format}\n"
+            f"Scraped pages: {page_contents}",
+            system="Extract the exact final answer from the scraped content.",
+            cache=False
         )
 
 
@@ -197,16 +553,21 @@ async def compute_answer(question, file_urls, answer_format, current_page_url):
     # ----------------------------------------------------
     file_contents = []
     if file_urls:
-        async with httpx.AsyncClient(timeout=60) as client:
-            for url in file_urls:
-                abs_url = urljoin(current_page_url, url)
-                print("DOWNLOADING FILE:", url, "→", abs_url)
-                resp = await client.get(abs_url)
-                try:
-                    text = resp.content.decode(errors="ignore")
-                except:
-                    text = ""
-                file_contents.append({"filename": url.split("/")[-1], "content": text})
+        abs_urls = [urljoin(current_page_url, url) for url in file_urls]
+        for url, abs_url in zip(file_urls, abs_urls):
+            logger.debug("Downloading file: %s → %s", url, abs_url)
+        downloads = await asyncio.gather(*(download_file(u) for u in abs_urls), return_exceptions=True)
+        for url, dl in zip(file_urls, downloads):
+            if isinstance(dl, Exception):
+                logger.warning("Download failed: %s (%s)", url, dl)
+                continue
+            content_type, data = dl
+            filename = url.split("/")[-1]
+            file_contents.append({
+                "filename": filename,
+                "bytes": data,
+                "binary": not is_text_file(filename, content_type)
+            })
 
     # --------------------------------------
     # 3) TABULAR ALWAYS TAKES PRIORITY
@@ -214,7 +575,7 @@ async def compute_answer(question, file_urls, answer_format, current_page_url):
     if file_contents:
         tab_ans = await compute_tabular(question, file_contents)
         if tab_ans is not None:
-            print(f"✔ TABULAR COMPUTE SUCCESS → {tab_ans}")
+            logger.info("Tabular compute success → %s", tab_ans)
             return tab_ans
 
     # --------------------------------------
@@ -222,20 +583,22 @@ async def compute_answer(question, file_urls, answer_format, current_page_url):
     # --------------------------------------
     if task == "file_lookup" and file_contents:
         return await ask_llm(
-            f"Use ONLY the downloaded files to locate the answer.\n"
-            f"Files: {file_contents}\n"
+            f"Return only the answer in format = {answer_format}\n"
             f"Question: {question}\n"
-            f"Return only the answer in format = {answer_format}"
+            f"Files: {await files_for_prompt(file_contents)}",
+            system="Use ONLY the downloaded files to locate the answer.",
+            cache=False
         )
 
     # --------------------------------------
     # 5) FINAL FALLBACK
     # --------------------------------------
     return await ask_llm(
-        f"Solve the question.\n"
-        f"Files (if any): {file_contents}\n"
+        f"Return ONLY the answer in format = {answer_format}\n"
         f"Question: {question}\n"
-        f"Return ONLY the answer in format = {answer_format}"
+        f"Files (if any): {await files_for_prompt(file_contents)}",
+        system="Solve the question.",
+        cache=False
     )
 
 
@@ -243,23 +606,32 @@ async def compute_answer(question, file_urls, answer_format, current_page_url):
 async def solve_quiz(email, secret, initial_url):
     current = initial_url
     for _ in range(20):
-        html = await fetch_rendered_html(current)
+        html = RENDER_CACHE.get(current)
+        if html is None:
+            html = await fetch_rendered_html(current)
+            RENDER_CACHE[current] = html
         parsed = await parse_quiz(html)
 
-        answer = await compute_answer(
-            parsed["question"],
-            parsed["file_urls"],
-            parsed["answer_format"],
-            current
-        )
+        submit_url = urljoin(current, parsed["submit_url"])
+        logger.info("Submit URL: %s → %s", parsed["submit_url"], submit_url)
 
-        payload = {"email": email, "secret": secret, "url": current, "answer": answer}
+        # Warm the submit host while the answer is being computed
+        warm = asyncio.create_task(warm_connection(submit_url))
+        try:
+            answer = await compute_answer(
+                parsed["question"],
+                parsed["file_urls"],
+                parsed["answer_format"],
+                current
+            )
+        finally:
+            if not warm.done():
+                warm.cancel()
 
-        submit_url = urljoin(current, parsed["submit_url"])
-        print("SUBMIT URL =>", parsed["submit_url"], "→", submit_url)
+        payload = {"email": email, "secret": secret, "url": current, "answer": answer}
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            result = (await client.post(submit_url, json=payload)).json()
+        r = await HTTP_CLIENT.post(submit_url, content=orjson.dumps(payload), headers=JSON_HEADERS)
+        result = orjson.loads(r.content)
 
         if not result.get("correct"):
             if result.get("url"):